@@ -3,10 +3,46 @@ import json
 import logging.handlers
 from pathlib import Path
 import datetime as dt
-from typing_extensions import override
+import enum
+import uuid
+import argparse
+import atexit
+import copy
+import io
+import os
+import queue
+import sys
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder when orjson isn't installed
+    orjson = None
+
+# Serializer used by MyJSONFormatter; orjson encodes datetimes natively so the
+# formatter can hand them over without calling isoformat() itself
+if orjson is not None:
+    _dumps = orjson.dumps
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    # raised for values orjson rejects without consulting default=, e.g. ints beyond 64 bits
+    _JSONEncodeError = orjson.JSONEncodeError
+else:
+    _dumps = None
+    _ORJSON_OPTIONS = None
+    _JSONEncodeError = TypeError
+
+# Separators giving the stdlib encoder orjson's compact layout; the fallback also passes
+# ensure_ascii=False so non-ASCII text is written as raw UTF-8 like orjson does. Floats can
+# still differ: the stdlib writes NaN/Infinity where orjson writes null, and exponents as
+# 1e+16 where orjson writes 1e16
+_JSON_SEPARATORS = (",", ":")
+
+try:
+    import msgpack
+except ImportError:  # only needed by MsgPackBytesHandler and for reading .mpk logs
+    msgpack = None
 
 # Set of built-in logging attributes
-LOG_RECORD_BUILTIN_ATTRS = {
+LOG_RECORD_BUILTIN_ATTRS = frozenset({
     "args",
     "asctime",
     "created",
@@ -30,8 +66,46 @@ LOG_RECORD_BUILTIN_ATTRS = {
     "thread",
     "threadName",
     "taskName"
+})
+
+# UTC tzinfo used for ISO-8601 timestamps, bound once instead of looked up per record
+_UTC = dt.timezone.utc
+_fromtimestamp = dt.datetime.fromtimestamp
+
+# Fields computed by the formatter itself rather than read off the log record, in output order
+ALWAYS_FIELDS = ("message", "timestamp", "exc_info", "stack_info")
+
+# Encoders for values the JSON serializer can't write natively, looked up by exact type.
+# orjson already handles datetimes, UUIDs and enums itself; they're listed for the stdlib
+# fallback so both serializers encode them the same way
+_JSON_ENCODERS = {
+    dt.datetime: dt.datetime.isoformat,
+    dt.date: dt.date.isoformat,
+    dt.time: dt.time.isoformat,
+    uuid.UUID: str,
+    set: list,
+    frozenset: list,
 }
 
+def _json_default(obj):
+    """
+    The `default=` hook for the JSON serializer, called for values it can't encode itself.
+
+    Args:
+        obj (Any): The value to encode.
+
+    Returns:
+        Any: A JSON-serializable replacement; anything without a dedicated encoder becomes `str(obj)`.
+    """
+    encode = _JSON_ENCODERS.get(type(obj))
+    if encode is not None:
+        return encode(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (dt.date, dt.time)):
+        return obj.isoformat()
+    return str(obj)
+
 class MyJSONFormatter(logging.Formatter):
     """
     A custom logging formatter that formats log records as JSON objects.
@@ -39,6 +113,8 @@ class MyJSONFormatter(logging.Formatter):
     Args:
         fmt_keys (dict[str, str], optional): A dictionary that maps log record keys to their desired
             output key names in the JSON format. Defaults to None.
+        unix_ts (bool, optional): If True, the timestamp is emitted as the record's Unix epoch
+            float; if False, as an ISO-8601 string in UTC. Defaults to True.
 
     Preconditions:
         - `fmt_keys` must be a dictionary mapping log record attributes to their corresponding keys in the output.
@@ -48,6 +124,7 @@ class MyJSONFormatter(logging.Formatter):
 
     Methods:
         format(record): Formats the log record as a JSON string.
+        serialize(record): Formats the log record as UTF-8 encoded JSON bytes.
         _prepare_log_dict(record): Prepares the log record dictionary before conversion to JSON.
 
     Returns:
@@ -59,16 +136,76 @@ class MyJSONFormatter(logging.Formatter):
         >>> logger.setFormatter(formatter)
     """
     
-    def __init__(self, *, fmt_keys: dict[str, str] | None = None):
+    def __init__(self, *, fmt_keys: dict[str, str] | None = None, unix_ts: bool = True):
         super().__init__()
         self.fmt_keys = fmt_keys if fmt_keys is not None else {}
-
-    @override
-    def format(self, record: logging.LogRecord) -> str:
+        self.unix_ts = unix_ts
+
+        # fmt_keys is fixed after construction, so split it once into output keys filled from
+        # formatter-computed fields and output keys read off the record, plus the always
+        # fields left over for the end.
+        # Names read from a JSON config aren't interned; interning them lets lookups in
+        # record.__dict__ (whose keys are interned) match on identity
+        self._out_keys = tuple(sys.intern(key) for key in self.fmt_keys)
+        self._always_plan = tuple(
+            (sys.intern(key), val) for key, val in self.fmt_keys.items() if val in ALWAYS_FIELDS
+        )
+        self._attr_plan = tuple(
+            (sys.intern(key), sys.intern(val))
+            for key, val in self.fmt_keys.items()
+            if val not in ALWAYS_FIELDS
+        )
+        self._leftover_fields = tuple(
+            field for field in ALWAYS_FIELDS if field not in self.fmt_keys.values()
+        )
+
+        # key layout of every record dict: the fmt_keys followed by the leftover fields that
+        # are always present. Copying it gives a table already sized and ordered for the
+        # output, so filling it in never resizes (exc_info/stack_info are appended when set)
+        self._template = dict.fromkeys(
+            self._out_keys
+            + tuple(field for field in ("message", "timestamp") if field in self._leftover_fields)
+        )
+
+    # The hot methods below take module-level helpers as keyword-only defaults, which makes
+    # them fast locals instead of globals looked up on every record; callers never pass them.
+
+    # override
+    def format(self, record: logging.LogRecord, *, _dumps=_dumps, _default=_json_default,
+               _option=_ORJSON_OPTIONS) -> str:
         message = self._prepare_log_dict(record)
-        return json.dumps(message, default=str)
+        if _dumps is not None:
+            try:
+                return _dumps(message, default=_default, option=_option).decode()
+            except _JSONEncodeError:
+                # the stdlib encoder handles what orjson can't, such as arbitrarily large ints
+                pass
+        return json.dumps(message, default=_default, separators=_JSON_SEPARATORS, ensure_ascii=False)
+
+    def serialize(self, record: logging.LogRecord, *, _dumps=_dumps, _default=_json_default,
+                  _option=_ORJSON_OPTIONS) -> bytes:
+        """
+        Formats the log record as UTF-8 encoded JSON, skipping the decode done by `format`.
 
-    def _prepare_log_dict(self, record: logging.LogRecord):
+        Args:
+            record (logging.LogRecord): The log record object.
+
+        Returns:
+            bytes: The JSON document for the record, without a trailing newline.
+        """
+        message = self._prepare_log_dict(record)
+        if _dumps is not None:
+            try:
+                return _dumps(message, default=_default, option=_option)
+            except _JSONEncodeError:
+                pass
+        # surrogatepass: lone surrogates are one of the values orjson rejects
+        return json.dumps(
+            message, default=_default, separators=_JSON_SEPARATORS, ensure_ascii=False
+        ).encode("utf-8", errors="surrogatepass")
+
+    def _prepare_log_dict(self, record: logging.LogRecord, *, _fromtimestamp=_fromtimestamp,
+                          _UTC=_UTC, _builtin_attrs=LOG_RECORD_BUILTIN_ATTRS, _str=str):
         """
         Prepares the log record as a dictionary for JSON serialization.
 
@@ -83,39 +220,82 @@ class MyJSONFormatter(logging.Formatter):
             >>> formatter = MyJSONFormatter()
             >>> formatted_log = formatter._prepare_log_dict(record)
         """
-        always_fields = {
-            "message": record.getMessage(),
-            "timestamp": dt.datetime.fromtimestamp(
-                record.created, tz=dt.timezone.utc
-            ).isoformat(),
-        }
+        # read record attributes straight from its __dict__ rather than through getattr
+        record_dict = record.__dict__
+
+        if self.unix_ts:
+            timestamp = record.created
+        else:
+            timestamp = _fromtimestamp(record.created, _UTC)
+
+        # getMessage() would only rebuild the same string for a plain message without args
+        msg = record.msg
+        if record.args or type(msg) is not _str:
+            msg = record.getMessage()
+
+        if not self._out_keys and record.exc_info is None and record.stack_info is None:
+            # fast path: nothing to remap and no traceback text to render
+            message = {"message": msg, "timestamp": timestamp}
+        else:
+            always_fields = {
+                "message": msg,
+                "timestamp": timestamp,
+            }
+
+            if record.exc_info is not None:
+                always_fields["exc_info"] = self._format_exc_info(record)
+
+            if record.stack_info is not None:
+                always_fields["stack_info"] = self.formatStack(record.stack_info)
+
+            # the template fixes the key order, so the output follows fmt_keys across both loops
+            message = self._template.copy()
+            for key, field in self._always_plan:
+                message[key] = always_fields.get(field)
+            for key, attr in self._attr_plan:
+                message[key] = record_dict.get(attr)
+
+            for field in self._leftover_fields:
+                if field in always_fields:
+                    message[field] = always_fields[field]
+
+        # the key-view difference runs in C and is empty unless the caller passed extra=...
+        extras = record_dict.keys() - _builtin_attrs
+        if extras:
+            # walk the record dict rather than the set so extras keep their insertion order
+            for key in record_dict:
+                if key in extras:
+                    message[key] = record_dict[key]
 
-        if record.exc_info is not None:
-            always_fields["exc_info"] = self.formatException(record.exc_info)
+        return message
 
-        if record.stack_info is not None:
-            always_fields["stack_info"] = self.formatException(record.stack_info)
+    def _format_exc_info(self, record: logging.LogRecord) -> str:
+        """
+        Formats the record's exception, reusing the text another formatter already stored on the record.
 
-        message = {
-            key: msg_val
-            if (msg_val := always_fields.pop(val, None)) is not None
-            else getattr(record, val)
-            for key, val in self.fmt_keys.items()
-        }
-        message.update(always_fields)
+        Args:
+            record (logging.LogRecord): A log record whose `exc_info` is set.
 
-        for key, val in record.__dict__.items():
-            if key not in LOG_RECORD_BUILTIN_ATTRS:
-                message[key] = val
+        Postconditions:
+            - `record.exc_text` holds the formatted traceback, as `logging.Formatter.format` does,
+              so other handlers' formatters don't walk the traceback again.
 
-        return message
+        Returns:
+            str: The formatted traceback text.
+        """
+        if record.exc_text:
+            return record.exc_text
 
-class NonErrorFilter(logging.Filter):
+        text = self.formatException(record.exc_info)
+        record.exc_text = text
+        return text
+
+def non_error_filter(record: logging.LogRecord) -> bool:
     """
     A logging filter that allows only non-error logs (INFO level and below).
 
-    Methods:
-        filter(record): Filters log records based on their log level.
+    Loggers and handlers accept plain callables as filters, so this is a function rather
+    than a `logging.Filter` subclass to avoid the method dispatch per record.
 
     Args:
         record (logging.LogRecord): The log record to filter.
@@ -125,13 +305,213 @@ class NonErrorFilter(logging.Filter):
 
     Example:
         >>> logger = logging.getLogger("my_logger")
-        >>> filter = NonErrorFilter()
-        >>> logger.addFilter(filter)
+        >>> logger.addFilter(non_error_filter)
+    """
+    return record.levelno <= logging.INFO
+
+def make_non_error_filter():
+    """
+    Returns `non_error_filter`, for setting the filter up from a dictConfig file.
+
+    dictConfig builds filters by calling a '()' factory, so this zero-argument factory
+    hands it the bare function, and the handler calls it directly for each record.
+
+    Returns:
+        Callable[[logging.LogRecord], bool]: The `non_error_filter` function.
+
+    Example:
+        In logging_config.json:
+
+        "filters": {
+            "non_error": {"()": "logger.make_non_error_filter"}
+        }
+
+        and add "filters": ["non_error"] to a handler.
+    """
+    return non_error_filter
+
+class JSONLBytesHandler(logging.handlers.RotatingFileHandler):
+    """
+    A rotating file handler that appends JSON Lines to a binary file.
+
+    Records formatted by `MyJSONFormatter` are written as the serializer's bytes plus a
+    newline, with no text encoding or newline translation, and each record is formatted
+    once (RotatingFileHandler formats it a second time to check the file size).
+    Other formatters' output is encoded as UTF-8.
+
+    Args:
+        filename (str): The path to the log file.
+        maxBytes (int, optional): Roll over once the file would exceed this size; 0 never rolls over. Defaults to 0.
+        backupCount (int, optional): The number of rotated files to keep. Defaults to 0.
+        delay (bool, optional): Open the file on the first write instead of immediately. Defaults to False.
+        buffering (int, optional): The size of the file's write buffer in bytes. Defaults to 64 KiB.
+        flushLevel (int, optional): Records at or above this level flush the buffer to the file
+            straight away; lower records are written out when the buffer fills or the handler
+            is flushed or closed. Defaults to logging.ERROR.
+
+    Example:
+        >>> handler = JSONLBytesHandler("logs/Logs.log.jsonl", maxBytes=1000000, backupCount=3)
+        >>> handler.setFormatter(MyJSONFormatter())
+        >>> logging.getLogger("my_logger").addHandler(handler)
+    """
+
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0, delay: bool = False,
+                 buffering: int = 1 << 16, flushLevel: int = logging.ERROR):
+        # set before the base class opens the file through _open()
+        self.buffering = buffering
+        self.flushLevel = flushLevel
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, delay=delay)
+        self.mode = "ab"
+
+    # override
+    def _open(self):
+        stream = self._builtin_open(self.baseFilename, "ab", buffering=self.buffering)
+        stream.seek(0, os.SEEK_END)
+        return stream
+
+    def _encode_record(self, record: logging.LogRecord) -> bytes:
+        """
+        Encodes the log record as the bytes written to the file, including the line terminator.
+        """
+        if isinstance(self.formatter, MyJSONFormatter):
+            return self.formatter.serialize(record) + b"\n"
+        return self.format(record).encode("utf-8") + b"\n"
+
+    # override
+    def emit(self, record: logging.LogRecord):
+        try:
+            data = self._encode_record(record)
+
+            if self.stream is None:
+                self.stream = self._open()
+            if (self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes
+                    and os.path.isfile(self.baseFilename)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(data)
+            if record.levelno >= self.flushLevel:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class MsgPackBytesHandler(JSONLBytesHandler):
     """
+    A rotating file handler that appends log records to a binary file as MessagePack maps.
+
+    MessagePack objects are self-delimiting, so records are simply concatenated; the file
+    is read back with `read_msgpack_log` or converted to JSON Lines, in the same compact layout
+    `JSONLBytesHandler` writes, with `python logger.py <file>.mpk`. The record dict is the one `MyJSONFormatter` builds
+    (other formatters' output is stored under "message"), and values MessagePack can't
+    encode go through the same encoder as the JSON output. Requires the `msgpack` package.
+
+    Args:
+        Same as `JSONLBytesHandler`.
 
-    @override
-    def filter(self, record: logging.LogRecord) -> bool | logging.LogRecord:
-        return record.levelno <= logging.INFO
+    Example:
+        Add it next to (or instead of) the JSONL handler in logging_config.json; under the
+        name "file_msgpack", `setup_logging` points its filename at 'logs/Logs.log.mpk' next
+        to the script, like it does for "file_json":
+
+        "file_msgpack": {
+            "class": "logger.MsgPackBytesHandler",
+            "level": "DEBUG",
+            "formatter": "json",
+            "filename": "logs/Logs.log.mpk",
+            "maxBytes": 1000000,
+            "backupCount": 3
+        }
+    """
+
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0, delay: bool = False,
+                 buffering: int = 1 << 16, flushLevel: int = logging.ERROR):
+        if msgpack is None:
+            raise ImportError("MsgPackBytesHandler requires the msgpack package")
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, delay=delay,
+                         buffering=buffering, flushLevel=flushLevel)
+        self._packer = msgpack.Packer(default=_json_default, use_bin_type=True)
+
+    # override
+    def _encode_record(self, record: logging.LogRecord) -> bytes:
+        if isinstance(self.formatter, MyJSONFormatter):
+            message = self.formatter._prepare_log_dict(record)
+        else:
+            message = {"message": self.format(record)}
+        return self._packer.pack(message)
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler for an in-process queue that leaves formatting to the listener thread.
+
+    The stock QueueHandler formats each record on the calling thread and strips exc_info
+    so the record can be pickled. Records here never leave the process, so only the
+    message arguments are merged (they may be mutated by the caller after the log call)
+    and the exception info is kept for the JSON formatter.
+
+    Trade-off: values passed with `extra=` and the exc_info objects are not copied. They
+    are shared by reference and converted (`str()` or the JSON `default=` hook) later, on
+    the listener thread, so a record can show state the caller changed after logging and
+    their `__str__` must be safe to call from another thread. Pass immutable values, or
+    format them into the message arguments, when that matters.
+    """
+
+    # override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # a plain message without args has nothing to merge, so the record is queued as is
+        if not record.args and type(record.msg) is str:
+            return record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# Listener draining the root logger's queue, replaced on every setup_logging() call
+_queue_listener = None
+
+def _stop_queue_listener():
+    """
+    Stops the background listener, writing out any records still queued.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+# registered after logging's own shutdown hook, so it runs first and the handlers are still open
+atexit.register(_stop_queue_listener)
+
+# Locations relative to this module, resolved once at import
+_MODULE_DIR = Path(__file__).resolve().parent
+_LOG_DIR = _MODULE_DIR / "logs"
+_LOG_FILE = _LOG_DIR / "Logs.log.jsonl"
+_MSGPACK_LOG_FILE = _LOG_DIR / "Logs.log.mpk"
+_CONFIG_FILE = _MODULE_DIR / "logging_configs/logging_config.json"
+
+# Parsed logging config as ((config file, mtime_ns), config), reused until the file changes
+_config_cache = None
+
+def _load_config(config_file: Path) -> dict:
+    """
+    Loads a JSON logging config, reparsing it only when the file has been modified.
+
+    Args:
+        config_file (Path): The path to the logging configuration file.
+
+    Returns:
+        dict: The parsed configuration; the same object is returned while the file is unchanged.
+    """
+    global _config_cache
+    cache_key = (config_file, config_file.stat().st_mtime_ns)
+    if _config_cache is not None and _config_cache[0] == cache_key:
+        return _config_cache[1]
+
+    data = config_file.read_bytes()
+    config = orjson.loads(data) if orjson is not None else json.loads(data)
+    _config_cache = (cache_key, config)
+    return config
 
 def setup_logging():
     """
@@ -146,11 +526,17 @@ def setup_logging():
     Postconditions:
         - Logging is configured as per the JSON configuration.
         - The log file is set to be stored in the 'logs' directory.
+        - The root logger's handlers run on a background QueueListener thread; the root
+          logger itself only holds a QueueHandler.
+        - Message arguments are merged on the calling thread, but `extra=` values and
+          exception info are serialized later on the listener thread, so they should not be
+          mutated after the log call (see `_LocalQueueHandler`).
 
     Vars:
-        log_dir (Path): The path to the log directory.
-        log_file (Path): The path to the JSON log file.
-        config_file (Path): The path to the logging configuration file.
+        _LOG_DIR (Path): The path to the log directory.
+        _LOG_FILE (Path): The path to the JSON log file.
+        _MSGPACK_LOG_FILE (Path): The path to the MessagePack log file, if a "file_msgpack" handler is configured.
+        _CONFIG_FILE (Path): The path to the logging configuration file.
 
     Returns:
         None: The function configures the logger and does not return any value.
@@ -160,23 +546,142 @@ def setup_logging():
         >>> logger = logging.getLogger("my_logger")
         >>> logger.info("Logging setup complete.")
     """
-    log_dir = Path(__file__).parent / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # set up log file location relative to the script location and create the log file
-    log_file = log_dir / "Logs.log.jsonl"
+    # create the log directory next to the script on first use
+    if not _LOG_DIR.exists():
+        _LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     # load logging config from JSON file in the 'logging_configs' directory
-    config_file = Path(__file__).parent / "logging_configs/logging_config.json"
-    with open(config_file) as f_in:
-        config = json.load(f_in)
+    config = _load_config(_CONFIG_FILE)
 
     # update the filename in the configuration to use the dynamically determined path to the log file
     if 'handlers' in config and 'file_json' in config['handlers']: 
-        config['handlers']['file_json']['filename'] = str(log_file)
+        config['handlers']['file_json']['filename'] = str(_LOG_FILE)
+    if 'handlers' in config and 'file_msgpack' in config['handlers']:
+        config['handlers']['file_msgpack']['filename'] = str(_MSGPACK_LOG_FILE)
+
+    # drain records queued by a previous call before dictConfig closes the old handlers
+    _stop_queue_listener()
 
     # configure logging using the updated configuration
     logging.config.dictConfig(config)
 
+    # move the configured handlers behind a queue so formatting and file I/O happen on the
+    # listener thread and the calling thread only pays for the enqueue
+    global _queue_listener
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(_LocalQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+def _json_text(obj) -> str:
+    """
+    Encodes a record dict in the same layout `MyJSONFormatter` writes, for the offline tools.
+    """
+    if _dumps is not None:
+        try:
+            return _dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode()
+        except _JSONEncodeError:
+            pass
+    return json.dumps(obj, default=_json_default, separators=_JSON_SEPARATORS, ensure_ascii=False)
+
+def convert_timestamps(lines, key: str = "timestamp"):
+    """
+    Converts Unix epoch timestamps in JSON log lines to ISO-8601 strings for human readers.
+
+    Args:
+        lines (Iterable[str]): JSON Lines log records, e.g. an open log file.
+        key (str, optional): The output key holding the timestamp. Defaults to "timestamp".
+
+    Postconditions:
+        - Numeric timestamps are replaced by ISO-8601 strings in UTC; all other values are untouched.
+        - Blank lines are skipped.
+
+    Returns:
+        Iterator[str]: The converted log records, one JSON string per record.
+
+    Example:
+        >>> with open("logs/Logs.log.jsonl") as f_in:
+        ...     for line in convert_timestamps(f_in):
+        ...         print(line)
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        yield _json_text(_with_iso_timestamp(json.loads(line), key))
+
+def _with_iso_timestamp(record: dict, key: str) -> dict:
+    """
+    Replaces a numeric timestamp under `key` in the record with an ISO-8601 string in UTC.
+    """
+    timestamp = record.get(key)
+    if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+        record[key] = dt.datetime.fromtimestamp(timestamp, _UTC).isoformat()
+    return record
+
+def read_msgpack_log(f_in):
+    """
+    Reads the records written by `MsgPackBytesHandler`.
+
+    Args:
+        f_in (BinaryIO): The .mpk log file, opened in binary mode.
+
+    Returns:
+        Iterator[dict]: The log records, in the order they were written.
+
+    Example:
+        >>> with open("logs/Logs.log.mpk", "rb") as f_in:
+        ...     for record in read_msgpack_log(f_in):
+        ...         print(record["message"])
+    """
+    if msgpack is None:
+        raise ImportError("reading .mpk logs requires the msgpack package")
+    return iter(msgpack.Unpacker(f_in, raw=False, strict_map_key=False))
+
+def main(argv: list[str] | None = None):
+    """
+    Command line entry point: converts a log file for reading or further processing.
+
+    A JSON Lines log (or `-` for JSON Lines on stdin) is printed with its Unix epoch
+    timestamps converted to ISO-8601. Files ending in .mpk are read as MessagePack logs
+    written by `MsgPackBytesHandler` and printed as JSON Lines in the same compact layout as
+    the JSONL log, timestamps unchanged; pipe that into `python logger.py -` for ISO-8601.
+
+    Example:
+        $ python logger.py logs/Logs.log.jsonl > logs/readable.jsonl
+        $ python logger.py logs/Logs.log.mpk > logs/from_mpk.jsonl
+        $ python logger.py logs/Logs.log.mpk | python logger.py - > logs/readable.jsonl
+    """
+    parser = argparse.ArgumentParser(
+        description="Convert Unix epoch timestamps in a JSON Lines log to ISO-8601, "
+                    "or a .mpk MessagePack log to JSON Lines."
+    )
+    parser.add_argument("log_file", help="path to the .jsonl or .mpk log file, or - for JSON Lines on stdin")
+    parser.add_argument("--key", default="timestamp", help="name of the timestamp key (JSON Lines input only)")
+    args = parser.parse_args(argv)
+
+    # the log is UTF-8 regardless of the platform's default encoding, so read and write it as such
+    out = sys.stdout.buffer
+
+    if args.log_file != "-" and Path(args.log_file).suffix == ".mpk":
+        with open(args.log_file, "rb") as f_in:
+            for record in read_msgpack_log(f_in):
+                out.write(_json_text(record).encode("utf-8", errors="surrogatepass") + b"\n")
+        return
+
+    if args.log_file == "-":
+        f_in = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    else:
+        f_in = open(args.log_file, encoding="utf-8")
+    with f_in:
+        for line in convert_timestamps(f_in, key=args.key):
+            out.write(line.encode("utf-8", errors="surrogatepass") + b"\n")
+
 # Initialize logger for use in the rest of the program (can change the name as needed to fit the program context)
-a_logger = logging.getLogger("my_logger")
\ No newline at end of file
+a_logger = logging.getLogger("my_logger")
+
+if __name__ == "__main__":
+    main()
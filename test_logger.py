@@ -1,3 +1,4 @@
+import logging
 import logger
 
 logger.setup_logging()
@@ -11,13 +12,22 @@ def main():
     logger.a_logger.error("error")
     logger.a_logger.critical("critical")
     logger.a_logger.exception("exception")
+
+    # pass values as arguments instead of building the string yourself; they are only
+    # formatted if the record is actually emitted
+    payload = {"x": "hello"}
+    logger.a_logger.debug("debug %s", payload)
+
+    # guard anything expensive to compute so it is skipped entirely when DEBUG is filtered out
+    if logger.a_logger.isEnabledFor(logging.DEBUG):
+        logger.a_logger.debug("debug payload keys %s", sorted(payload))
     
     try: 
         # Intentional syntax error
         test(something)
     except Exception as e:
         # Log the exception
-        logger.a_logger.exception(f"Exception: {e}")
+        logger.a_logger.exception("Exception: %s", e)
 
 main()
 
@@ -27,21 +37,22 @@ main()
 # The log file is created if it doesn't exist.
 # The log file is appended to if it already exists.
 # The log file contains all log records, including debug and info logs.
-# The log file does not contain error logs (warning, error, critical, and exception logs). But these can be added by removing the NonErrorFilter filter.
+# The log file also contains error logs (warning, error, critical, and exception logs). To keep them out, add "filters": {"non_error": {"()": "logger.make_non_error_filter"}} to logging_config.json and "filters": ["non_error"] to the file_json handler.
 # The log file contains the log records in JSON Lines format.
-# The log file contains the log records in the following format:
+# The log file contains the log records in the following format (one record per line, shown expanded here):
 #     {
-#         "timestamp": "2021-07-17 14:31:19,123",
 #         "level": "INFO",
-#         "name": "my_logger",
-#         "message": "Logging setup complete."
-#     }
-#     {
-#         "timestamp": "2021-07-17 14:31:19,123",
-#         "level": "DEBUG",
-#         "name": "my_logger",
-#         "message": "debug"
+#         "message": "info",
+#         "timestamp": 1791957540.44,
+#         "logger": "my_logger",
+#         "module": "test_logger",
+#         "function": "main",
+#         "line": 10,
+#         "thread_name": "MainThread"
 #     }
+# The timestamp is a Unix epoch float (seconds, UTC). Set "unix_ts": false on the "json" formatter in
+# logging_config.json to write ISO-8601 strings instead, or convert an existing log for reading with:
+#     python logger.py logs/Logs.log.jsonl > logs/readable.jsonl
 # This is just a small example of how to use the logger. You can customize the logger further by adding more handlers, filters, and formatters as needed. 
 # You can also configure the logger to log to different destinations such as files, console, email, and more.
 # The logger can be used to log messages, exceptions, and other information in a structured and configurable way.
\ No newline at end of file